@@ -10,6 +10,7 @@ from .models import Stamp, Signet as ApprovalSignet
 
 class ApprovalSignoff(BaseSignoff):
     """ An abstract, base Signoff Type backed by a ApprovalSignet - a Signet with a FK relation to an ApprovalStamp """
+    __slots__ = ()
     signetModel = ApprovalSignet
 
 
@@ -13,6 +13,7 @@ class SimpleSignoff(BaseSignoff):
     A basic Signoff Type that can be used out-of-the-box for simple use-cases where any user can sign off
     Backed by signoffs.contrib.signets.models.Signet model.
     """
+    __slots__ = ()
     signetModel = Signet
     revokeModel = None               # revoking a SimpleSignoff just deletes it
     perm = None                      # unrestricted - any user can sign this
@@ -22,6 +23,7 @@ class SimpleSignoff(BaseSignoff):
 @register(id='signoffs.revokable-signoff')
 class RevokableSignoff(SimpleSignoff):
     """ A SimpleSignoff that stores a "receipt" when a signoff is revoked """
+    __slots__ = ()
     revokeModel = RevokedSignet
     revoke_perm = None               # same permission to sign the Signoff also used to revoke it
 
@@ -29,4 +31,5 @@ class RevokableSignoff(SimpleSignoff):
 @register(id='signoffs.irrevokable-signoff')
 class IrrevokableSignoff(SimpleSignoff):
     """ A SimpleSignoff that can never be revoked """
+    __slots__ = ()
     revoke_perm = False
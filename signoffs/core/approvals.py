@@ -6,6 +6,7 @@
         - one concrete Stamp model can back any number of Approval Types
         - can think of an Approval instance as the "plugin behaviour" for a Stamp instance.
 """
+import collections.abc
 import inspect
 from typing import Callable, Type, Optional, Union
 
@@ -42,6 +43,46 @@ def revoke_approval(approval, user, reason=''):
     approval.save()
 
 
+class NextSignoffs(collections.abc.Sequence):
+    """
+    Sequence of the next signoff instance(s) in an approval's signing order, also indexable by Signoff Type id.
+        next = approval.next_signoffs()
+        next[0], next[-1]          # by position, like a list
+        next['myapp.final_signoff']  # by Signoff Type id
+    """
+    def __init__(self, signoffs=()):
+        self.signoffs = tuple(signoffs)
+        self.signoffs_by_id = {signoff.id: signoff for signoff in self.signoffs}
+
+    def __getitem__(self, index):
+        """ index may be a position in this sequence or a Signoff Type id """
+        return self.signoffs_by_id[index] if isinstance(index, str) else self.signoffs[index]
+
+    def __len__(self):
+        return len(self.signoffs)
+
+    def __iter__(self):
+        return iter(self.signoffs)
+
+    def __eq__(self, other):
+        """ Compares equal to any sequence (e.g., list or tuple) of the same signoffs, in the same order """
+        if isinstance(other, collections.abc.Sequence) and not isinstance(other, str):
+            return list(self.signoffs) == list(other)
+        return NotImplemented
+
+    __hash__ = None
+
+    def __str__(self):
+        return '{seq}'.format(seq=[str(s) for s in self.signoffs])
+
+    def __repr__(self):
+        return '<{cls} {signoffs}>'.format(cls=type(self).__name__, signoffs=list(self.signoffs))
+
+    def get(self, signoff_id, default=None):
+        """ Return the next signoff of the given Signoff Type id, default if no such signoff is next """
+        return self.signoffs_by_id.get(signoff_id, default)
+
+
 class AbstractApproval:
     """
     Defines the signing order and semantics for an Approval
@@ -110,9 +151,13 @@ class AbstractApproval:
         return cls.stampModel
 
     @classmethod
-    def get_stamp_queryset(cls, prefetch=('signatories',)):
-        """ Return a base (unfiltered) queryset of ALL Stamps for this Approval Type """
-        return cls.get_stampModel().objects.filter(approval_id=cls.id).prefetch_related(*prefetch).all()
+    def get_stamp_queryset(cls, prefetch=None):
+        """
+        Return a base (unfiltered) queryset of ALL Stamps for this Approval Type
+        Signatories and their users are prefetched, unless a sequence of prefetch lookups is given
+        """
+        stamps = cls.get_stampModel().objects.filter(approval_id=cls.id)
+        return stamps.prefetch_signatories() if prefetch is None else stamps.prefetch_related(*prefetch)
 
     # Approval Type behaviours
 
@@ -168,7 +213,7 @@ class AbstractApproval:
 
     def has_signed(self, user):
         """ Return True iff given user is a signatory on this approval's set of signoffs """
-        return any(s.user == user for s in self.signatories.all())
+        return any(s.user == user for s in self._fetch_signatories())
 
     def can_approve(self):
         """ return True iff this approval may be approved (regardless of completing signoffs!) """
@@ -221,14 +266,30 @@ class AbstractApproval:
         """
         return self.stamp.signatories
 
+    def _prefetched_signatories(self):
+        """ Return the Signets prefetched with stamp's signatories, None if not prefetched or signatories overridden """
+        if type(self).signatories is not AbstractApproval.signatories:
+            return None
+        return getattr(self.stamp, '_prefetched_objects_cache', {}).get('signatories')
+
+    def _fetch_signatories(self):
+        """ Return list of this approval's signatory Signets - as prefetched with stamp, or with users in one query """
+        prefetched = self._prefetched_signatories()
+        return list(prefetched) if prefetched is not None else list(self.signatories.all().select_related('user'))
+
     @property
     def timestamp(self):
         """ Return the timestamp approval was granted, None otherwise """
         return self.stamp.timestamp if self.is_approved() else None
 
+    def _signatory_count(self):
+        """ Return number of signatories on this approval, counted in-memory if signets were prefetched with stamp """
+        prefetched = self._prefetched_signatories()
+        return len(prefetched) if prefetched is not None else self.signatories.count()
+
     def has_signatories(self):
         """ return True iff this approval has any signatories """
-        return len(self.signatories) > 0
+        return self._signatory_count() > 0
 
     def is_approved(self):
         """ return True iff this Approval is in an approved state """
@@ -251,19 +312,26 @@ class AbstractApproval:
         Default implementation returns False if no signing order, True if the signing order is complete.
         Concrete Approval Types can override this method to customize conditions under which this approval is complete.
         """
-        return self.signing_order and self.signing_order.match.is_complete
+        match = self._signing_order_match()
+        return match is not None and match.is_complete
 
     def next_signoffs(self, for_user=None):
         """
-        Return list of next signoff instance(s) required in this approval process.
-        Default impl returns next signoffs from the approval's signing order or [] if no signing order is available.
+        Return NextSignoffs sequence of next signoff instance(s) required in this approval process.
+        Default impl returns next signoffs from the approval's signing order, empty if no signing order is available.
         Concrete Approval Types can override this with custom business logic to provide signing order automation.
         """
-        signoff_types = self.signing_order.match.next if self.signing_order else []
-        return [
+        match = self._signing_order_match()
+        signoff_types = match.next if match is not None else []
+        return NextSignoffs(
             signoff(stamp=self.stamp, user=for_user) for signoff in signoff_types
             if (for_user is None or signoff.is_permitted_signer(for_user))
-        ]
+        )
+
+    def _signing_order_match(self):
+        """ Return signing order MatchResult for this approval's current signatories, None if no signing order """
+        signing_order = self.signing_order
+        return signing_order.match if signing_order else None
 
     def can_sign(self, user):
         """ return True iff the given user can sign any of the next signoffs required on this approval """
@@ -1,9 +1,73 @@
 """
     Custom object and query managers.
 """
+import collections.abc
+from functools import cached_property
+
+from django.db.models import prefetch_related_objects
+
 from signoffs import registry
 
 
+class WrappedQuerySet(collections.abc.Sequence):
+    """
+    A lazy sequence of wrapper objects (e.g., Signoffs or Approvals), one for each instance in a queryset,
+        optionally filtered in-memory by field values (e.g., signoff_id='my.signoff').
+    Neither the queryset nor the wrapper objects are evaluated until needed, and both are only evaluated once.
+    """
+    def __init__(self, queryset, wrap, prefetch=(), **filters):
+        """
+        wrap is a callable that returns the wrapper object for a single queryset instance
+        prefetch is a sequence of lookups prefetched onto the queryset's instances when it is evaluated here,
+            unless already cached on them.  An already evaluated queryset (e.g., a prefetch cache) is used as-is.
+        """
+        self.queryset = queryset
+        self.wrap = wrap
+        self.prefetch = prefetch
+        self.filters = filters
+
+    @cached_property
+    def instances(self):
+        """ The filtered list of queryset instances - evaluates the queryset, or uses its result cache """
+        prefetch = self.prefetch if self.queryset._result_cache is None else ()
+        queryset = list(self.queryset)
+        if prefetch:
+            # prefetched onto every instance in the queryset's result cache, so it is re-used across filters
+            prefetch_related_objects(queryset, *prefetch)
+        return [
+            obj for obj in queryset if all(getattr(obj, fld) == value for fld, value in self.filters.items())
+        ]
+
+    @cached_property
+    def objects(self):
+        """ The list of wrapper objects, one per filtered instance """
+        return [self.wrap(obj) for obj in self.instances]
+
+    def values_list(self, *fields, **kwargs):
+        """ Return a values_list queryset for the filtered queryset, without constructing any wrapper objects """
+        return self.queryset.filter(**self.filters).values_list(*fields, **kwargs)
+
+    def __getitem__(self, index):
+        return self.objects[index]
+
+    def __len__(self):
+        return len(self.instances)
+
+    def __iter__(self):
+        return iter(self.objects)
+
+    def __eq__(self, other):
+        """ Compares equal to any sequence (e.g., list or tuple) of the same wrapper objects, in the same order """
+        if isinstance(other, collections.abc.Sequence) and not isinstance(other, str):
+            return self.objects == list(other)
+        return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self):
+        return '<{cls} {objects}>'.format(cls=type(self).__name__, objects=self.objects)
+
+
 class QuerySetApiMixin:
     """
     Delegates common methods to a query manager or queryset to emulate a queryset-like API,
@@ -71,7 +135,7 @@ class SignoffSetManager(SignetSetApiMixin):
 
     # Customize queryset emulation provided by Signets Set API Mixin
     def all(self):
-        """ Return list of signoffs in this set, ordered chronologically  """
+        """ Return lazy sequence (WrappedQuerySet) of signoffs in this set, ordered chronologically  """
         return super().all().signoffs(signoff_id=self.signoff_type.id)
 
     def _pre_save_owner(self):
@@ -170,7 +234,7 @@ class StampSignoffsManager(SignetSetApiMixin):
 
     # Customize queryset emulation provided by Signets Set API Mixin
     def all(self):
-        """ Return list of signoffs in this approval, ordered chronologically  """
+        """ Return lazy sequence (WrappedQuerySet) of signoffs in this approval, ordered chronologically  """
         return super().all().signoffs()
 
 
@@ -208,7 +272,7 @@ class ApprovalSetManager(ApprovalStampSetApiMixin):
 
     # Customize queryset emulation provided by Stamp Set API Mixin
     def all(self):
-        """ Return list of approvals in this set, ordered chronologically  """
+        """ Return lazy sequence (WrappedQuerySet) of approvals in this set, ordered chronologically  """
         return super().all().approvals(approval_id=self.approval_type.id)
 
     def create(self, **kwargs):
@@ -9,10 +9,11 @@ To revoke a Signet, we can simply delete the Signet record.
 To maintain a "blame" history, we can instead record who and when the signet was revoked with a RevokedSignet.
 """
 from django.db import models
-from django.core.exceptions import ImproperlyConfigured, PermissionDenied, FieldError, ValidationError
+from django.core.exceptions import PermissionDenied, FieldError, ValidationError
 from django.contrib.auth import get_user_model
 from django.contrib.auth.models import AnonymousUser
 from signoffs import settings
+from .managers import WrappedQuerySet
 
 on_delete_user = getattr(models, settings.SIGNOFFS_ON_DELETE_USER)
 nullable_user = settings.SIGNOFFS_ON_DELETE_USER == 'SET_NULL'
@@ -42,10 +43,13 @@ class SignetQuerySet(models.QuerySet):
 
     def signoffs(self, signoff_id=None):
         """
-        Returns list of signoff objects, one for each signet in queryset,
+        Returns lazy sequence of signoff objects, one for each signet in queryset,
             optionally filtered for specific signoff type - filtering done in-memory for performance.
+        Signing users are prefetched onto the signets in one query when the queryset is evaluated,
+            unless already selected or prefetched on them.
         """
-        return [signet.signoff for signet in self if signoff_id is None or signet.signoff_id == signoff_id]
+        filters = dict(signoff_id=signoff_id) if signoff_id is not None else {}
+        return WrappedQuerySet(self, lambda signet: signet.signoff, prefetch=('user', ), **filters)
 
 
 BaseSignetManager = models.Manager.from_queryset(SignetQuerySet)
@@ -112,12 +116,12 @@ class AbstractSignet(models.Model):
 
     @property
     def signoff_type(self):
-        """ Return the Signoff Type (class) that governs this signet """
-        from signoffs.registry import signoffs
-        signoff_type = signoffs.get(self.signoff_id)
-        if not signoff_type:
-            raise ImproperlyConfigured('''Signoff type {type} not registered.
-            See AUTODISCOVER settings to discover signoff types when django loads.'''.format(type=signoff_type))
+        """ Return the Signoff Type (class) that governs this signet - cached on instance until signoff_id changes """
+        signoff_id, signoff_type = self.__dict__.get('_signoff_type_cache', (None, None))
+        if signoff_type is None or signoff_id != self.signoff_id:
+            from signoffs.registry import get_signoff_type
+            signoff_type = get_signoff_type(self.signoff_id)
+            self._signoff_type_cache = (self.signoff_id, signoff_type)
         return signoff_type
 
     def get_signoff(self):
@@ -153,6 +157,12 @@ class AbstractSignet(models.Model):
         """ return True if this Signet has been revoked """
         return hasattr(self, 'revoked')
 
+    def __getstate__(self):
+        """ Signoff Types are created dynamically by register(), so the cached type can't be pickled """
+        state = super().__getstate__()
+        state.pop('_signoff_type_cache', None)
+        return state
+
     def has_valid_signoff(self):
         """ return True iff this Signet has a valid signoff_id """
         from signoffs import registry
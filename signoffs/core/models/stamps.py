@@ -12,9 +12,12 @@ Once granted, the Stamp persists its "approved" status, regardless of the state
 To revoke a Stamp, we alter the approval status and revoke the Signet(s) used to grant the Approval.
 A "blame" history, may be maintained by using a RevokeSignet model on the Approval Type.
 """
+from collections import namedtuple
+
 from django.db import models
-from django.core.exceptions import ImproperlyConfigured, PermissionDenied, ValidationError
+from django.core.exceptions import PermissionDenied, ValidationError
 
+from .managers import WrappedQuerySet
 from .signets import AbstractSignet
 
 
@@ -25,6 +28,25 @@ class AbstractApprovalSignet(AbstractSignet):
     class Meta:
         abstract = True
 
+    def save(self, *args, **kwargs):
+        result = super().save(*args, **kwargs)
+        self.clear_prefetched_signatories()
+        return result
+
+    def delete(self, *args, **kwargs):
+        self.clear_prefetched_signatories()
+        return super().delete(*args, **kwargs)
+
+    def clear_prefetched_signatories(self):
+        """ Signatories prefetched on the stamp go stale when this signet is saved or deleted, like related managers """
+        field = self._meta.get_field('stamp')
+        if field.is_cached(self):
+            getattr(field.get_cached_value(self), '_prefetched_objects_cache', {}).pop('signatories', None)
+
+
+# A read-only, lightweight view of an approval, built from a stamp's column values without loading the Stamp model
+ApprovalView = namedtuple('ApprovalView', ['pk', 'approved', 'approval_type'])
+
 
 class ApprovalStampQuerySet(models.QuerySet):
     """
@@ -42,16 +64,34 @@ class ApprovalStampQuerySet(models.QuerySet):
         """ Prefetch related signets but not the signing users """
         return self.prefetch_related('signatories')
 
+    def signatories_prefetch(self):
+        """ Return a Prefetch lookup for related signets with their signing users, selected in a single query """
+        signet_model = self.model._meta.get_field('signatories').related_model
+        return models.Prefetch('signatories', queryset=signet_model._default_manager.select_related('user'))
+
     def prefetch_signatories(self):
-        """ Prefetch related signets and their signing users """
-        return self.prefetch_related('signatories__user')
+        """ Prefetch related signets and their signing users, selected together in a single query """
+        return self.prefetch_related(self.signatories_prefetch())
 
-    def approvals(self, approval_id=None):
+    def approvals(self, approval_id=None, lightweight=False):
         """
-        Returns list of approval objects, one for each seal in queryset,
+        Returns lazy sequence of approval objects, one for each seal in queryset,
             optionally filtered for specific approval type - filtering done in-memory for performance.
+        Signatories and their users are prefetched onto the stamps in one query when the queryset is evaluated,
+            unless already prefetched on them.
+        lightweight=True returns a list of ApprovalView tuples instead, for large lists of approvals,
+            evaluated immediately with a single query, filtered for approval type in the DB,
+            and without loading Stamp models or their signatories.
         """
-        return [seal.approval for seal in self if approval_id is None or seal.approval_id == approval_id]
+        if lightweight:
+            from signoffs.registry import get_approval_type
+            qs = self.filter(approval_id=approval_id) if approval_id is not None else self
+            return [
+                ApprovalView(row.pk, row.approved, get_approval_type(row.approval_id))
+                for row in qs.values_list('pk', 'approved', 'approval_id', named=True)
+            ]
+        filters = dict(approval_id=approval_id) if approval_id is not None else {}
+        return WrappedQuerySet(self, lambda seal: seal.approval, prefetch=(self.signatories_prefetch(), ), **filters)
 
 
 ApprovalStampManager = models.Manager.from_queryset(ApprovalStampQuerySet)
@@ -90,12 +130,12 @@ class AbstractApprovalStamp(models.Model):
 
     @property
     def approval_type(self):
-        """ Return the Approval Type (class) that governs this stamp """
-        from signoffs.registry import approvals
-        approval_type = approvals.get(self.approval_id)
-        if not approval_type:
-            raise ImproperlyConfigured('''Approval type {type} not registered.
-            See AUTODISCOVER settings to discover approval types when django loads.'''.format(type=approval_type))
+        """ Return the Approval Type (class) that governs this stamp - cached on instance until approval_id changes """
+        approval_id, approval_type = self.__dict__.get('_approval_type_cache', (None, None))
+        if approval_type is None or approval_id != self.approval_id:
+            from signoffs.registry import get_approval_type
+            approval_type = get_approval_type(self.approval_id)
+            self._approval_type_cache = (self.approval_id, approval_type)
         return approval_type
 
     def get_approval(self):
@@ -130,6 +170,12 @@ class AbstractApprovalStamp(models.Model):
         from signoffs import registry
         return self.approval_id is not None and self.approval_id in registry.approvals
 
+    def __getstate__(self):
+        """ Approval Types are created dynamically by register(), so the cached type can't be pickled """
+        state = super().__getstate__()
+        state.pop('_approval_type_cache', None)
+        return state
+
     def save(self, *args, **kwargs):
         """ Add a 'sigil' label if there is not one & check user has permission to save this stamp """
         self.full_clean()
@@ -25,6 +25,16 @@ class Pattern:
 #
 
 
+ESCAPE_SET = ['-', '.', '|', '(', ')', '{', '}', '+', '*', '?']
+
+
+def group_name(s):
+    """ Return the name of the regex group that captures string token s """
+    for e in ESCAPE_SET:
+        s = s.replace(e, '')
+    return s
+
+
 def wrap(s):
     """
     Create a Pattern out of a single string token
@@ -34,13 +44,10 @@ def wrap(s):
         the regular expression chunk puts s into a named group, so matched instances can later be retrieved by name
     """
     if isinstance(s, str):
-        escape_set = ['-', '.', '|', '(', ')', '{', '}', '+', '*', '?']
-        group_name = s
         s_pat = s
-        for e in escape_set:
+        for e in ESCAPE_SET:
             s_pat = s_pat.replace(e, '\\' + e)
-            group_name = group_name.replace(e, '')
-        return Pattern(r'((?P<' + group_name + r'>' + s_pat + r') )', [s])
+        return Pattern(r'((?P<' + group_name(s) + r'>' + s_pat + r') )', [s])
     else:
         return s
 
@@ -27,7 +27,7 @@ class SigningOrderManager:
     """
     def __init__(self, pattern: pm.SigningOrderPattern, signets_queryset):
         """
-        Match the signets queryset against the Singing Order pattern
+        Match the signets queryset (or manager) against the Singing Order pattern
         signet_set must be ordered chronologically (by timestamp), which is default ordering for Signet
         """
         validate_signing_order_pattern(pattern)
@@ -36,11 +36,17 @@ class SigningOrderManager:
 
     @property
     def match(self):
-        """ Return a pm.MatchResult object for matching pattern against queryset (lazy evaluation) """
-        return self.pattern.match(*list(self.signets_queryset))
+        """
+        Return a pm.MatchResult object for matching pattern against current signets in queryset (lazy evaluation)
+        Signets are fetched in a single query - only their signoff_id is matched, so no related objects are loaded.
+        """
+        # filter() clones the queryset, so current signets are fetched, never a related manager's prefetch cache.
+        return self.pattern.match(*list(self.signets_queryset.all().filter()))
 
 
 class SigningOrder:
+    accessor_field_name = None  # set when descriptor is assigned to a class attribute
+
     def __init__(self, *pattern, signet_set_accessor='signatories'):
         """
         Pattern object is a sequence of Signoff Types defining the signing order, typically for an Approval.
@@ -53,13 +59,20 @@ class SigningOrder:
         self.pattern = pattern
         self.signet_set_accessor = signet_set_accessor
 
+    def __set_name__(self, owner, name):
+        """ Name of attribute this descriptor is assigned to on owner """
+        self.accessor_field_name = name
+
     def __get__(self, instance, owner=None):
         """
         Use the enclosing instance to instantiate and return a SigningOrderManager for the instance.signet_set
+          and replace descriptor with that object, so it is built and validated only once per instance
         """
         if instance is None:  # class access - nada - nothing useful?
             return self
-        else:  # return a SigningOrderManager to match this SigningOrder against the instance's signet_set
+        else:  # on instance, replace descriptor with SigningOrderManager for the instance's signet_set
             signet_set_accessor = getattr(instance, self.signet_set_accessor)
-            signoffs_pattern = SigningOrderManager(pattern=self.pattern, signets_queryset=signet_set_accessor.all())
+            signoffs_pattern = SigningOrderManager(pattern=self.pattern, signets_queryset=signet_set_accessor)
+            if self.accessor_field_name:
+                setattr(instance, self.accessor_field_name, signoffs_pattern)
             return signoffs_pattern
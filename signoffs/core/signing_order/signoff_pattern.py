@@ -1,18 +1,20 @@
 """
 Signing Order pattern matching language. Defines the pattern for a Signing Order using Signoff Types
 
-Pattern Matching is backed by regex_match backend (currently not replaceable, but that'd be a nice idea :-)
+Patterns are compiled to a deterministic state-transition table (DFA) for matching;
+  the equivalent regex_match backend pattern is still available via SigningOrderPattern.pattern_matcher
 """
 import collections.abc
+from dataclasses import dataclass
 from functools import cached_property
-from itertools import chain
-from types import SimpleNamespace
+from itertools import chain, permutations
+from types import MappingProxyType, SimpleNamespace
 
 from signoffs import registry
 
 from .regex_match import (
     exactly_one, zero_or_one, zero_or_more, one_or_more, n_or_more, exactly_n,
-    in_series, all_of, one_of, PatternMatcher
+    in_series, all_of, one_of, group_name, MatchResult, PatternMatcher
 )
 
 #
@@ -47,6 +49,150 @@ def regex_pattern(pattern, to_str):
     return pattern
 
 
+# Pattern compilation
+
+
+class NFA:
+    """
+    Builder for a non-deterministic finite automaton (Thompson construction) over string tokens.
+    States are ints; each pattern fragment is a (start, end) pair of states, joined by epsilon moves.
+    Fragments are built by "builder" callables, so repeated terms can be built afresh for each repetition.
+    """
+    def __init__(self):
+        self.moves = []  # state -> list of (token, target state) - token is None for epsilon moves
+
+    def state(self):
+        self.moves.append([])
+        return len(self.moves) - 1
+
+    def move(self, source, target, token=None):
+        self.moves[source].append((token, target))
+
+    def token(self, token):
+        start, end = self.state(), self.state()
+        self.move(start, end, token)
+        return start, end
+
+    def series(self, *builders):
+        start = end = self.state()
+        for build in builders:
+            s, e = build(self)
+            self.move(end, s)
+            end = e
+        return start, end
+
+    def alternation(self, *builders):
+        start, end = self.state(), self.state()
+        for build in builders:
+            s, e = build(self)
+            self.move(start, s)
+            self.move(e, end)
+        return start, end
+
+    def repeat(self, build, min_count, max_count=None):
+        """ Fragment repeating build min_count to max_count times, unbounded if max_count is None """
+        start = end = self.state()
+        for _ in range(min_count):
+            s, e = build(self)
+            self.move(end, s)
+            end = e
+        if max_count is None:  # loop back on one more copy
+            s, e = build(self)
+            loop_end = self.state()
+            self.move(end, s)
+            self.move(e, s)
+            self.move(end, loop_end)
+            self.move(e, loop_end)
+            end = loop_end
+        else:
+            for _ in range(max_count - min_count):  # optional copies
+                s, e = build(self)
+                opt_end = self.state()
+                self.move(end, s)
+                self.move(end, opt_end)
+                self.move(e, opt_end)
+                end = opt_end
+        return start, end
+
+    def closure(self, states):
+        """ Return frozenset of all states reachable from given states by epsilon moves """
+        reached, stack = set(states), list(states)
+        while stack:
+            for token, target in self.moves[stack.pop()]:
+                if token is None and target not in reached:
+                    reached.add(target)
+                    stack.append(target)
+        return frozenset(reached)
+
+    def tokens(self):
+        """ Return tuple of unique tokens, in the order they appear in the NFA """
+        return tuple(dict.fromkeys(token for moves in self.moves for token, _ in moves if token is not None))
+
+
+@dataclass(frozen=True)
+class CompiledPattern:
+    """
+    A compiled Signing Order pattern: a DFA with int states, where state 0 is the initial state.
+    transitions[state] maps each token allowed next in that state to the following state - dead states are pruned,
+        so the keys are exactly the next tokens that keep the sequence valid.
+    """
+    tokens: tuple
+    transitions: tuple
+    accepting: frozenset
+
+    @classmethod
+    def from_nfa(cls, nfa, start, accept):
+        """ Subset construction: each DFA state is the set of NFA states reachable on the same token sequence """
+        tokens = nfa.tokens()
+        initial = nfa.closure({start})
+        state_ids = {initial: 0}
+        state_sets = [initial]
+        transitions = []
+        for states in state_sets:  # state_sets grows as new states are discovered
+            moves = {}
+            for token in tokens:
+                targets = {target for state in states for t, target in nfa.moves[state] if t == token}
+                if targets:
+                    targets = nfa.closure(targets)
+                    if targets not in state_ids:
+                        state_ids[targets] = len(state_sets)
+                        state_sets.append(targets)
+                    moves[token] = state_ids[targets]
+            transitions.append(moves)
+        accepting = frozenset(i for i, states in enumerate(state_sets) if accept in states)
+        # prune moves into dead states - those from which no accepting state can be reached
+        live = set(accepting)
+        while True:
+            reaching = {i for i, moves in enumerate(transitions) if i not in live and live & set(moves.values())}
+            if not reaching:
+                break
+            live |= reaching
+        transitions = tuple(
+            MappingProxyType({token: target for token, target in moves.items() if target in live})
+            for moves in transitions
+        )
+        return cls(tokens=tokens, transitions=transitions, accepting=accepting)
+
+    def match(self, token_strs):
+        """ Walk the token strings through the transition table, return a MatchResult """
+        state = 0
+        for token in token_strs:
+            state = self.transitions[state].get(token)
+            if state is None:
+                return MatchResult()
+        matched = {}
+        if token_strs:  # group tokens by name, as regex captures would
+            matched = {group_name(token): [] for token in self.tokens}
+            for token in token_strs:
+                matched[group_name(token)].append(token)
+        return MatchResult(
+            is_valid=True,
+            is_complete=bool(token_strs) and state in self.accepting,
+            matched=matched,
+            next=list(self.transitions[state]),
+        )
+
+
 # Singing Order Pattern Specifiers
 
 
@@ -74,12 +220,33 @@ class SigningOrderPattern(collections.abc.Sequence):
         construct = self.regex_pattern_constructor.__func__  # constructors are normal functions not methods!
         return construct(*regex_pattern(self.pattern, self.token_repr.pattern_to_str), **self.kwargs)
 
+    def term_builders(self):
+        """ Return list of NFA fragment builders, one for each term in this pattern """
+        return [
+            (lambda nfa, p=p: p.nfa_fragment(nfa)) if isinstance(p, SigningOrderPattern) else
+            (lambda nfa, t=self.token_repr.pattern_to_str(p): nfa.token(t))
+            for p in self.pattern
+        ]
+
+    def nfa_fragment(self, nfa):
+        """ Add this pattern to the NFA, return its (start, end) states """
+        return nfa.series(*self.term_builders())
+
+    def compile(self):
+        """ Return a CompiledPattern with the state-transition table for this pattern """
+        nfa = NFA()
+        start, accept = self.nfa_fragment(nfa)
+        return CompiledPattern.from_nfa(nfa, start, accept)
+
+    @cached_property
+    def compiled(self):
+        """ Pattern is immutable, so it only needs to be compiled once """
+        return self.compile()
+
     def match(self, *tokens):
         """ Returns a MatchResult object that compares iterable of tokens to this pattern """
-        token_str = ' '.join(self.token_repr.to_str(s) for s in tokens)
-        match = self.pattern_matcher.match(token_str)
-        if match.is_valid:
-            match.next = [self.token_repr.pattern_from_str(id) for id in match.next]
+        match = self.compiled.match([self.token_repr.to_str(s) for s in tokens])
+        match.next = [self.token_repr.pattern_from_str(id) for id in match.next]
         return match
 
     def __str__(self):
@@ -98,6 +265,12 @@ class SigningOrderPattern(collections.abc.Sequence):
 
 class TokenPattern(SigningOrderPattern):
     """ Abstract base for simple, un-nested patterns specified by a single token. """
+    repeat_range = (1, 1)  # (min, max) number of matching tokens, max is None for unbounded
+
+    def nfa_fragment(self, nfa):
+        builders = self.term_builders()
+        return nfa.repeat(lambda nfa: nfa.series(*builders), *self.repeat_range)
+
     def terms(self):
         """ return a flat set of pattern terms used in this pattern """
         return set(self.pattern)
@@ -111,16 +284,19 @@ class ExactlyOne(TokenPattern):
 class Optional(TokenPattern):
     """ A pattern that matches zero or one optional token """
     regex_pattern_constructor = zero_or_one
+    repeat_range = (0, 1)
 
 
 class ZeroOrMore(TokenPattern):
     """ A pattern that matches zero or more matching tokens """
     regex_pattern_constructor = zero_or_more
+    repeat_range = (0, None)
 
 
 class OneOrMore(TokenPattern):
     """ A pattern that is complete when there are one or more matching tokens """
     regex_pattern_constructor = one_or_more
+    repeat_range = (1, None)
 
 
 class NTokenPattern(TokenPattern):
@@ -134,6 +310,10 @@ class ExactlyN(NTokenPattern):
     """ A pattern that is complete with exactly n tokens """
     regex_pattern_constructor = exactly_n
 
+    @property
+    def repeat_range(self):
+        return self.kwargs['n'], self.kwargs['n']
+
 
 class AtLeastN(NTokenPattern):
     """
@@ -142,6 +322,10 @@ class AtLeastN(NTokenPattern):
     """
     regex_pattern_constructor = n_or_more
 
+    @property
+    def repeat_range(self):
+        return self.kwargs['n'], None
+
 
 # Pattern Sets
 
@@ -158,6 +342,9 @@ class AnyOneOf(PatternSet):
     """ A pattern that matches any one of a set of alternate patterns """
     regex_pattern_constructor = one_of
 
+    def nfa_fragment(self, nfa):
+        return nfa.alternation(*self.term_builders())
+
 
 class InSeries(PatternSet):
     """ A pattern where tokens must be in sequential order """
@@ -173,3 +360,9 @@ class InParallel(PatternSet):
           It may be possible to handle AtLeastN terms as non-sequential, but a look-ahead match algorithm is needed?
     """
     regex_pattern_constructor = all_of
+
+    def nfa_fragment(self, nfa):
+        """ Like the regex backend, match any permutation of the terms in series """
+        return nfa.alternation(*(
+            lambda nfa, terms=terms: nfa.series(*terms) for terms in permutations(self.term_builders())
+        ))
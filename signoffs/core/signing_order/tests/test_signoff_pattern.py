@@ -222,3 +222,17 @@ class SignoffPatternExampleUsageTests(SimpleTestCase):
         self.assertMatch(match, True, False, [C, ])
         match = self.pattern.match(A(), B(), )
         self.assertMatch(match, True, False, [B, C])
+
+    def test_compiled_pattern(self):
+        compiled = self.pattern.compiled
+        self.assertIs(self.pattern.compiled, compiled)
+        self.assertEqual(compiled.tokens, ('A', 'B', 'C'))
+        state = 0
+        for token in ('B', 'A', 'C', 'A', 'A', 'A'):
+            state = compiled.transitions[state][token]
+        self.assertIn(state, compiled.accepting)
+        self.assertEqual(tuple(compiled.transitions[state]), ('A', ))
+        next_state = compiled.transitions[state]['A']
+        self.assertEqual(compiled.transitions[next_state]['A'], next_state)  # AtLeastN loops once satisfied
+        after_a = compiled.transitions[0]['A']
+        self.assertNotIn('A', compiled.transitions[after_a])  # dead ends are pruned from the table
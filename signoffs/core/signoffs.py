@@ -54,6 +54,9 @@ class AbstractSignoff:
         - they are registered in the signoffs.registry.signoffs where they can be retrieved by id
     Signet records are stored in DB with a reference to Signoff.id - be cautious not to change or delete in-use id's!
     """
+    # instance state is just the signet, so no per-instance __dict__ - subclasses should declare __slots__ = () too
+    __slots__ = ('signet', )
+
     # id must be unique per type class, but human-legible / meaningful - dotted path recommended e.g. 'myapp.signoff'
     id: str = 'signoff.abstract'  # unique identifier for type - used like FK, don't mess with these!
 
@@ -74,6 +77,9 @@ class AbstractSignoff:
     label: str = ''         # Label for form field (i.e., checkbox) e.g. 'Report reviewed', empty string for no label
     render: SignoffRenderer = SignoffRenderer()   # object that knows how to render a signoff
 
+    # id: (base class, register kwargs, Signoff Type) for each Type created by register() - makes it idempotent
+    _registry_cache = {}
+
     # Registration for Signoff Types (sub-classes)
 
     @classmethod
@@ -82,12 +88,18 @@ class AbstractSignoff:
         Create, register, and return a new subclass of cls with overrides for given kwargs attributes
         Standard mechanism to define new Signoff types, typically in my_app/models.py or my_app/signoffs.py
             MySignoff = AbstractSignoff.register('my_signoff_type', label='Sign it!', ...)
+        Registering the same id again with the same base class and kwargs returns the existing Signoff Type.
         """
         from signoffs import registry
-        class_name = utils.id_to_camel(id)
         kwargs['id'] = id
+        kwargs.setdefault('__slots__', ())
+        base, registered_kwargs, signoff_type = cls._registry_cache.get(id, (None, None, None))
+        if base is cls and registered_kwargs == kwargs and registry.signoffs.get(id) is signoff_type:
+            return signoff_type
+        class_name = utils.id_to_camel(id)
         signoff_type = type(class_name, (cls,), kwargs)
         registry.signoffs.register(signoff_type)
+        cls._registry_cache[id] = (cls, kwargs, signoff_type)
         return signoff_type
 
     @classmethod
@@ -282,6 +294,7 @@ class BaseSignoff(AbstractSignoff):
     A base Signoff Type to be used as base class or to register concrete Signoff Types
     Concrete Types will require a concrete Signet Model to back the signoff.  Add a permission to restrict who can sign.
     """
+    __slots__ = ()
     id = 'signoffs.base-signoff'
     signetModel = None                  # Concrete signetModel must be defined for registered Signoffs
     revokeModel = None                  # revoking a signet just deletes it unless a revokeModel is provided
@@ -2,18 +2,43 @@
     Test fixture factories for signoff models
 """
 import uuid
-from functools import partial
+from functools import partial, lru_cache
+from itertools import chain
 from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import make_password
 from django.contrib.auth.models import Permission
 from django.contrib.contenttypes.models import ContentType
+from django.db.models.signals import post_migrate
+from django.dispatch import receiver
 
 
 User = get_user_model()
 auth_content_type = partial(ContentType.objects.get_for_model, User)
 
+# Permissions used throughout the test suite are created along with the test DB, so, unlike permissions created
+#   during a TestCase, they survive every test's rollback and can safely be cached for the whole test run.
+TEST_PERMS = ('some_perm', 'revoke_perm', 'add_signoff')
+
+
+@receiver(post_migrate, dispatch_uid='signoffs.core.tests.fixtures.create_test_perms')
+def create_test_perms(sender, **kwargs):
+    """ Create the TEST_PERMS once auth is migrated into a (new) test DB """
+    if sender.label == 'auth':
+        get_test_perm.cache_clear()
+        for codename in TEST_PERMS:
+            Permission.objects.get_or_create(codename=codename, name=codename.title(), content_type=auth_content_type())
+
+
+@lru_cache(maxsize=None)
+def get_test_perm(codename):
+    """ Return one of the TEST_PERMS - only one query per permission for entire test run """
+    return Permission.objects.get(codename=codename, content_type=auth_content_type())
+
 
 def get_perm(codename, name=None, content_type=None):
     """ Get or create and return a permission with given codename """
+    if codename in TEST_PERMS and name is None and content_type in (None, auth_content_type()):
+        return get_test_perm(codename)
     name = name or codename.title()
     content_type = content_type or auth_content_type()
     perm, _ = Permission.objects.get_or_create(codename=codename, name=name, content_type=content_type, )
@@ -54,7 +79,48 @@ def get_user(first_name="Big", last_name="Bird", email="bigbird@example.com",
     else:
         revoke_all_permissions(user)
     grant_permissions(user, *perms)
-    # Add a few convenience methods to user object
+    return add_user_helpers(user)
+
+
+def get_users_bulk(*users, password="password"):
+    """
+    Return list of new user objects, one for each dict of user attributes, inserted with a few bulk queries.
+    Each dict takes same arguments as get_user, e.g., get_users_bulk(dict(username='bob', perms=('some_perm', )), ...)
+    """
+    users = [dict(dict(first_name="Big", last_name="Bird", email="bigbird@example.com"), **u) for u in users]
+    for u in users:
+        u['username'] = u.get('username') or str(uuid.uuid1())[:-10]
+    user_perms = [u.pop('perms', ()) for u in users]
+    password = make_password(password)  # hashing is deliberately slow - hash just once for all users
+    User.objects.bulk_create(User(password=password, **u) for u in users)
+    # bulk inserts don't return pk's on all backends - load the users back
+    users_by_name = User.objects.in_bulk([u['username'] for u in users], field_name='username')
+    users = [users_by_name[u['username']] for u in users]
+    perms = {codename: get_perm(codename) for codename in set(chain.from_iterable(user_perms))}
+    UserPermission = User.user_permissions.through
+    UserPermission.objects.bulk_create(
+        UserPermission(user_id=user.pk, permission_id=perms[codename].pk)
+        for user, codenames in zip(users, user_perms) for codename in codenames
+    )
+    return [add_user_helpers(user) for user in users]
+
+
+def get_approvals_bulk(approval_type, *stamps):
+    """
+    Return list of new approvals of given type, one for each dict of Stamp attributes, inserted with a single query.
+    e.g., get_approvals_bulk(MyApproval, {}, {}, dict(approved=True)) - 2 unapproved and 1 approved approval
+    Stamps are not save()'d or full_clean()'d, so only use with valid stamp attributes.
+    """
+    Stamp = approval_type.get_stampModel()
+    stamps = Stamp.objects.bulk_create(Stamp(approval_id=approval_type.id, **s) for s in stamps)
+    if stamps and stamps[0].pk is None:
+        # bulk inserts don't return pk's on all backends - load the stamps back, the newest ones of this type
+        stamps = reversed(Stamp.objects.filter(approval_id=approval_type.id).order_by('-pk')[:len(stamps)])
+    return [approval_type(stamp=stamp) for stamp in stamps]
+
+
+def add_user_helpers(user):
+    """ Add a few convenience methods to user object """
     user.grant_permission = grant_permissions.__get__(user)
     user.revoke_permission = revoke_permissions.__get__(user)
     user.revoke_all_permissions = revoke_all_permissions.__get__(user)
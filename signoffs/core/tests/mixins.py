@@ -0,0 +1,22 @@
+"""
+    Shared test case fixtures
+"""
+from . import fixtures
+
+
+class UsersAndApprovalMixin:
+    """
+    setUpTestData for test cases that need a restricted, an approving, and an unrestricted user,
+        and, optionally, a saved approval of type approval_type
+    """
+    approval_type = None  # Approval Type used to create cls.approval, None for no approval
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.restricted_user, cls.approving_user, cls.unrestricted_user = fixtures.get_users_bulk(
+            dict(username='restricted'),
+            dict(username='approving', perms=('some_perm',)),
+            dict(username='permitted', perms=('some_perm', 'revoke_perm')),
+        )
+        if cls.approval_type:
+            cls.approval = cls.approval_type().save()
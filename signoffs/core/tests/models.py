@@ -43,6 +43,7 @@ class ApprovalSignet(AbstractApprovalSignet):
 # Signoffs backed by the Signet models above
 
 class BasicSignoff(BaseSignoff):
+    __slots__ = ()
     signetModel = Signet
     label = 'Consent?'
 
@@ -51,10 +52,12 @@ simple_signoff_type = BasicSignoff.register(id='test.signoffs.simple_signoff')
 
 
 class ApprovalSignoff(BaseSignoff):
+    __slots__ = ()
     signetModel = ApprovalSignet
 
 
 class LeaveSignoff(BaseSignoff):
+    __slots__ = ()
     signetModel = 'signoffs.LeaveSignet'
     revokeModel = 'signoffs.RevokedLeaveSignet'
     label = 'Consent?'
@@ -1,14 +1,25 @@
 """
 App-independent tests for Approval models - no app logic
 """
+import pickle
+from operator import attrgetter
+
 from django.core import exceptions
+from django.contrib.auth import get_user_model
+from django.db import connection
 from django.test import SimpleTestCase, TestCase
-from signoffs.core.approvals import BaseApproval
+from django.test.utils import CaptureQueriesContext
+from signoffs.core.approvals import BaseApproval, NextSignoffs
 import signoffs.core.signing_order as so
+from signoffs.core.models.stamps import ApprovalView
 from signoffs.registry import approvals, register
 
 from .models import Stamp, OtherStamp, ApprovalSignoff, LeaveApproval
 from . import fixtures
+from .mixins import UsersAndApprovalMixin
+
+
+stamp_pk = attrgetter('stamp.pk')
 
 
 @register(id='signoffs.tests.my_approval')
@@ -40,28 +51,6 @@ class SimpleApprovalTypeTests(SimpleTestCase):
         with self.assertRaises(exceptions.ImproperlyConfigured):
             MyApproval.register(id='test.invalid.no_stamp', stampModel=None)
 
-
-class ApprovalTypeIntheritanceTests(SimpleTestCase):
-    def test_class_var_overrides(self):
-        a = MyApproval.register('signoff.test.my_approval.test1')
-        self.assertEqual(a.label, MyApproval.label)
-        self.assertEqual(a().stamp_model, Stamp)
-
-    def test_field_override(self):
-        a = MyApproval.register('signoff.test.my_approval.test2',
-                                label='Something', revoke_perm='auth.some_perm', stampModel=OtherStamp)
-        self.assertEqual(a.label, 'Something')
-        self.assertEqual(a.revoke_perm, 'auth.some_perm')
-        self.assertEqual(a().stamp_model, OtherStamp)
-
-
-class ApprovalTypeTests(TestCase):
-    @classmethod
-    def setUpTestData(cls):
-        cls.restricted_user = fixtures.get_user(username='restricted')
-        cls.approving_user = fixtures.get_user(username='approving', perms=('some_perm',))
-        cls.unrestricted_user = fixtures.get_user(username='permitted', perms=('some_perm', 'revoke_perm'))
-
     def test_init(self):
         stamp = Stamp(approval_id=MyApproval.id)
         a1 = MyApproval(stamp=stamp)  # with explicit stamp
@@ -80,39 +69,110 @@ class ApprovalTypeTests(TestCase):
         with self.assertRaises(exceptions.ImproperlyConfigured):
             a1(stamp=stamp)                   # stamp model does not match approval
         a = a1()
-        self.assertFalse(a.can_revoke(user=self.restricted_user))  # approval requires permission
+        restricted_user = get_user_model()(username='restricted')
+        self.assertFalse(a.can_revoke(user=restricted_user))  # approval requires permission
         with self.assertRaises(exceptions.PermissionDenied):
-            a.revoke(user=self.restricted_user)
+            a.revoke(user=restricted_user)
+
+
+class ApprovalTypeIntheritanceTests(SimpleTestCase):
+    def test_class_var_overrides(self):
+        a = MyApproval.register('signoff.test.my_approval.test1')
+        self.assertEqual(a.label, MyApproval.label)
+        self.assertEqual(a().stamp_model, Stamp)
+
+    def test_field_override(self):
+        a = MyApproval.register('signoff.test.my_approval.test2',
+                                label='Something', revoke_perm='auth.some_perm', stampModel=OtherStamp)
+        self.assertEqual(a.label, 'Something')
+        self.assertEqual(a.revoke_perm, 'auth.some_perm')
+        self.assertEqual(a().stamp_model, OtherStamp)
+
 
+class ApprovalTypeTests(TestCase):
     def test_create(self):
         a = MyApproval.create()
         self.assertFalse(a.is_approved())
 
+    def test_get_approvals_bulk(self):
+        MyApproval.create()
+        with CaptureQueriesContext(connection) as context:
+            approvals = fixtures.get_approvals_bulk(MyApproval, {}, dict(approved=True), dict(approved=True))
+        inserts = [q for q in context.captured_queries if q['sql'].startswith('INSERT')]
+        self.assertEqual(len(inserts), 1)
+        self.assertLessEqual(len(context), 2)  # plus one read-back on backends that don't return pk's
+        self.assertTrue(all(isinstance(a, MyApproval) and a.stamp.pk for a in approvals))
+        self.assertEqual([a.is_approved() for a in approvals], [False, True, True])
+        self.assertEqual(MyApproval.get_stamp_queryset().approved().count(), 2)
 
-class SigningOrderTests(TestCase):
-    @classmethod
-    def setUpTestData(cls):
-        cls.restricted_user = fixtures.get_user(username='restricted')
-        cls.approving_user = fixtures.get_user(username='approving', perms=('some_perm',))
-        cls.unrestricted_user = fixtures.get_user(username='permitted', perms=('some_perm', 'revoke_perm'))
-        cls.approval = MyApproval().save()
+
+class SigningOrderTests(UsersAndApprovalMixin, TestCase):
+    approval_type = MyApproval
 
     def test_next_signoffs(self):
         u = self.unrestricted_user
-        next = self.approval.next_signoffs(for_user=u)
+        # signing order is matched against the approval's signatories, fetched in a single query per call
+        with self.assertNumQueries(1):
+            next = self.approval.next_signoffs(for_user=u)
         self.assertEqual(len(next), 1)
         self.assertEqual(next[0].id, MyApproval.first_signoff.id)
         self.assertEqual(next[0].signet.stamp, self.approval.stamp)
         self.assertTrue(next[0].can_sign(user=u))
+        self.assertFalse(self.approval.has_signatories())
         next[0].sign(user=u)
         self.assertEqual(self.approval.signatories.count(), 1)
-        next = self.approval.next_signoffs(for_user=u)
+        self.assertTrue(self.approval.has_signatories())
+        with self.assertNumQueries(1):
+            next = self.approval.next_signoffs(for_user=u)
         self.assertEqual(len(next), 1)
         self.assertEqual(next[0].id, MyApproval.second_signoff.id)
 
+    def test_next_signoffs_prefetched(self):
+        u = self.unrestricted_user
+        approval = MyApproval.get_stamp_queryset().approvals()[0]
+        self.assertFalse(approval.has_signatories() or approval.has_signed(u))
+        approval.next_signoffs(for_user=u)[0].sign(user=u)
+        # signing drops signatories prefetched on the stamp, and signing order never reads them
+        self.assertEqual(approval.next_signoffs(for_user=u)[0].id, MyApproval.second_signoff.id)
+        self.assertTrue(approval.has_signatories() and approval.has_signed(u))
+        approval.approve()
+        approval.revoke(user=u)
+        self.assertFalse(approval.has_signatories())
+
+    def test_signatories_override_prefetched(self):
+        approval_type = MyApproval.register(
+            'test.approval.final_signatories',
+            signatories=property(lambda approval: approval.stamp.signatories.filter(
+                signoff_id=MyApproval.final_signoff.id)),
+        )
+        u = self.unrestricted_user
+        approval = approval_type.create()
+        approval.next_signoffs(for_user=u)[0].sign(user=u)
+        approval = approval_type.get_stamp_queryset().approvals()[0]
+        # signatories prefetched with the stamp are ignored in favour of the overridden signatories
+        self.assertFalse(approval.has_signatories() or approval.has_signed(u))
+
+    def test_signet_set_accessor(self):
+        approval_type = MyApproval.register(
+            'test.approval.no_signatories',
+            no_signatories=property(lambda approval: approval.stamp.signatories.none()),
+            signing_order=so.SigningOrder(MyApproval.first_signoff, MyApproval.final_signoff,
+                                          signet_set_accessor='no_signatories'),
+        )
+        approval = approval_type.create()
+        u = self.unrestricted_user
+        next = approval.next_signoffs(for_user=u)
+        self.assertEqual(next[0].id, MyApproval.first_signoff.id)
+        next[0].sign(user=u)
+        # signing order only sees the signets from its own accessor
+        self.assertEqual(approval.next_signoffs(for_user=u)[0].id, MyApproval.first_signoff.id)
+
     def test_can_sign(self):
         u = self.unrestricted_user
         self.assertTrue(self.approval.can_sign(user=u))
+        approval = MyApproval()  # unsaved stamp has no signatories to fetch - pure signing order logic
+        with self.assertNumQueries(0):
+            self.assertTrue(approval.can_sign(user=u))
 
     def test_is_complete(self):
         self.assertFalse(self.approval.is_complete())
@@ -125,64 +185,79 @@ class SigningOrderTests(TestCase):
 
         next = self.approval.next_signoffs(for_user=u)
         self.assertEqual(len(next), 2)
-        final = [s for s in next if s.id == MyApproval.final_signoff.id][0]
-        final.sign(user=u)
+        self.assertEqual(next[1], next[MyApproval.final_signoff.id])
+        next[MyApproval.final_signoff.id].sign(user=u)
         self.assertTrue(self.approval.is_complete())
 
 
-class ApprovalTests(TestCase):
-    @classmethod
-    def setUpTestData(cls):
-        cls.user = fixtures.get_user()
-        cls.approval = MyApproval().save()
+class ApprovalTests(UsersAndApprovalMixin, TestCase):
+    approval_type = MyApproval
 
     def test_next_signoffs(self):
-        u = self.user
-        # One first_signoff
-        next = self.approval.next_signoffs(for_user=u)
+        u = self.unrestricted_user
+        # One first_signoff - each call fetches the approval's signatories in a single query
+        with self.assertNumQueries(1):
+            next = self.approval.next_signoffs(for_user=u)
         self.assertEqual(next[0].id, MyApproval.first_signoff.id)
         next[0].sign(user=u)
         # Two second_signoffs
-        next = self.approval.next_signoffs(for_user=u)
+        with self.assertNumQueries(1):
+            next = self.approval.next_signoffs(for_user=u)
         self.assertEqual(next[0].id, MyApproval.second_signoff.id)
         next[0].sign(user=u)
-        next = self.approval.next_signoffs(for_user=u)
+        with self.assertNumQueries(1):
+            next = self.approval.next_signoffs(for_user=u)
         self.assertEqual(next[0].id, MyApproval.second_signoff.id)
         next[0].sign(user=u)
-        next = self.approval.next_signoffs(for_user=u)
+        with self.assertNumQueries(1):
+            next = self.approval.next_signoffs(for_user=u)
         self.assertSetEqual({s.id for s in next}, {MyApproval.second_signoff.id, MyApproval.final_signoff.id})
         self.assertFalse(self.approval.is_complete() or self.approval.is_approved())
-        final_signoff = [s for s in next if s.id == MyApproval.final_signoff.id][0]
-        final_signoff.sign(user=u)
+        next[MyApproval.final_signoff.id].sign(user=u)
         self.assertTrue(self.approval.is_complete())
         self.assertFalse(self.approval.is_approved())
         self.approval.approve_if_ready()
         self.assertTrue(self.approval.is_approved())
+        self.assertTrue(self.approval.is_complete())
+
+    def test_next_signoffs_sequence(self):
+        next = self.approval.next_signoffs(for_user=self.unrestricted_user)
+        self.assertEqual(next, list(next))
+        self.assertEqual(next, tuple(next))
+        self.assertNotEqual(next, [])
+        self.assertNotEqual(next, 'not a signoff sequence')
+        self.assertEqual(NextSignoffs(), [])
+        self.assertTrue(repr(next).startswith('<NextSignoffs ['))
+
+    def test_force_approved_is_not_complete(self):
+        self.approval.approve()
+        self.assertTrue(self.approval.is_approved())
+        # approve() forces approved state regardless of signoffs - the signing order is still incomplete
+        self.assertFalse(self.approval.is_complete())
+        self.assertEqual(self.approval.next_signoffs()[0].id, MyApproval.first_signoff.id)
 
 
 class ApprovalQuerysetTests(TestCase):
     @classmethod
     def setUpTestData(cls):
-        cls.myapprovals= [
-            MyApproval.create(),
-            MyApproval.create(approved=True),
-            MyApproval.create(),
-        ]
-        cls.leaveapprovals= [
-            LeaveApproval.create(approved=True),
-            LeaveApproval.create(),
-        ]
+        cls.myapprovals = fixtures.get_approvals_bulk(MyApproval, {}, {}, dict(approved=True))
+        cls.leaveapprovals = fixtures.get_approvals_bulk(LeaveApproval, dict(approved=True), {})
 
     def test_stamp_queryset(self):
         myapproval_qs = MyApproval.get_stamp_queryset().approvals()
-        self.assertListEqual(myapproval_qs, self.myapprovals)
+        self.assertQuerysetEqual(myapproval_qs, [a.stamp.pk for a in self.myapprovals],
+                                 transform=stamp_pk, ordered=False)
         leaveapproval_qs = LeaveApproval.get_stamp_queryset().approvals()
-        self.assertListEqual(leaveapproval_qs, self.leaveapprovals)
+        self.assertQuerysetEqual(leaveapproval_qs, [a.stamp.pk for a in self.leaveapprovals],
+                                 transform=stamp_pk, ordered=False)
 
     def test_stamp_queryset_filter(self):
         approved_qs = MyApproval.get_stamp_queryset().filter(approved=True).approvals()
-        self.assertListEqual(approved_qs,
-                             [a for a in self.myapprovals if a.is_approved()])
+        self.assertQuerysetEqual(approved_qs,
+                                 [a.stamp.pk for a in self.myapprovals if a.is_approved()],
+                                 transform=stamp_pk, ordered=False)
+        self.assertCountEqual(approved_qs.values_list('pk', flat=True),
+                              [a.stamp.pk for a in self.myapprovals if a.is_approved()])
 
 
 class StampModelTests(TestCase):
@@ -190,6 +265,9 @@ class StampModelTests(TestCase):
         a = approvals.get('signoffs.tests.my_approval')
         p = Stamp(approval_id='signoffs.tests.my_approval')
         self.assertEqual(p.approval_type, a)
+        p.approval_id = LeaveApproval.id
+        self.assertEqual(p.approval_type, LeaveApproval)
+        self.assertEqual(pickle.loads(pickle.dumps(p)).approval_type, LeaveApproval)
 
     def test_invalid_approval_type(self):
         p = Stamp(approval_id='not.a.valid.type')
@@ -214,37 +292,62 @@ class StampQuerysetTests(TestCase):
     @classmethod
     def setUpTestData(cls):
         u = fixtures.get_user()
-        set1 = (
-            MyApproval.create(),
-            MyApproval.create(),
-        )
-        set2 = (
-            LeaveApproval.create(),
-            LeaveApproval.create(),
-            LeaveApproval.create(),
-        )
+        set1 = tuple(fixtures.get_approvals_bulk(MyApproval, {}, {}))
+        set2 = tuple(fixtures.get_approvals_bulk(LeaveApproval, {}, {}, {}))
+        for a in set1:
+            a.stamp.signatories.create(user=u, stamp=a.stamp, signoff_id=MyApproval.first_signoff.id)
         cls.all_approvals = set1 + set2
         cls.approval_set1, cls.approval_set2 = set1, set2
         cls.user = u
 
     def test_qs_basics(self):
         approvals = Stamp.objects.filter(approval_id=MyApproval.id)
-        self.assertQuerysetEqual(approvals.order_by('pk'), [a.stamp for a in self.approval_set1])
+        self.assertCountEqual(approvals, [a.stamp for a in self.approval_set1])
 
     def test_qs_approvals(self):
         approvals = MyApproval.get_stamp_queryset().approvals()
-        self.assertQuerysetEqual(approvals, self.approval_set1)
+        self.assertCountEqual(map(stamp_pk, approvals), map(stamp_pk, self.approval_set1))
 
     def test_qs_approvals_filter(self):
-        base_qs = Stamp.objects.order_by('pk')
-        self.assertQuerysetEqual(base_qs.approvals(approval_id=MyApproval.id), self.approval_set1)
-        self.assertQuerysetEqual(base_qs.approvals(approval_id=LeaveApproval.id), self.approval_set2)
+        base_qs = Stamp.objects.all()
+        self.assertCountEqual(map(stamp_pk, base_qs.approvals(approval_id=MyApproval.id)),
+                              map(stamp_pk, self.approval_set1))
+        self.assertCountEqual(map(stamp_pk, base_qs.approvals(approval_id=LeaveApproval.id)),
+                              map(stamp_pk, self.approval_set2))
+
+    def test_qs_approvals_lightweight(self):
+        with self.assertNumQueries(1):
+            views = Stamp.objects.approvals(approval_id=MyApproval.id, lightweight=True)
+        self.assertIsInstance(views, list)
+        self.assertCountEqual(views, [ApprovalView(a.stamp.pk, a.is_approved(), MyApproval)
+                                      for a in self.approval_set1])
+        self.assertEqual(len(Stamp.objects.approvals(lightweight=True)), len(self.all_approvals))
+
+    def test_qs_approvals_has_signed(self):
+        with self.assertNumQueries(2):
+            approvals = MyApproval.get_stamp_queryset().approvals()
+            self.assertTrue(all(a.has_signed(self.user) for a in approvals))
+
+    def test_qs_approvals_result_cache(self):
+        qs = Stamp.objects.all()
+        self.assertEqual(len(qs.approvals()), len(self.all_approvals))
+        self.assertFalse(qs._prefetch_related_lookups)
+        self.assertEqual(len(qs._result_cache), len(self.all_approvals))
+
+    def test_qs_approvals_signatories(self):
+        approvals = Stamp.objects.approvals()
+        self.assertEqual(len(approvals), len(self.all_approvals))  # signatories are prefetched with the stamps
+        with self.assertNumQueries(0):
+            self.assertEqual([a.has_signatories() for a in approvals],
+                             [a.id == MyApproval.id for a in approvals])
 
     def test_qs_approvals_performance(self):
         base_qs = Stamp.objects.all().order_by('pk')
-        with self.assertNumQueries(1):
+        with self.assertNumQueries(2):
             approvals1 = base_qs.approvals(approval_id=MyApproval.id)
             self.assertEqual(len(approvals1), len(self.approval_set1))
+            for a in approvals1:
+                self.assertTrue(all(s.user == self.user for s in a.signatories.all()))
             approvals2 = base_qs.approvals(approval_id=LeaveApproval.id)
             self.assertEqual(len(approvals2), len(self.approval_set2))
             self.assertEqual(len(base_qs.approvals()), len(self.all_approvals))
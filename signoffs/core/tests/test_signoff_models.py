@@ -1,6 +1,10 @@
 """
 App-independent tests for Signoff models - no app logic
 """
+import copy
+import pickle
+from operator import attrgetter
+
 from django.core import exceptions
 from django.contrib.auth import get_user_model
 from django.test import SimpleTestCase, TestCase
@@ -15,6 +19,8 @@ signoff2 = BasicSignoff.register(id='test.signoff2', signetModel=OtherSignet,
                                  label='Something', perm='auth.some_perm', revoke_perm='auth.revoke_perm')
 signoff3 = BasicSignoff.register(id='test.signoff3')
 
+signet_pk = attrgetter('signet.pk')
+
 
 class SimpleSignoffTypeTests(SimpleTestCase):
     def test_signoff_type_relations(self):
@@ -42,6 +48,21 @@ class SignoffTypeIntheritanceTests(SimpleTestCase):
         self.assertEqual(s.perm, 'auth.some_perm')
         self.assertEqual(s().signet_model, OtherSignet)
 
+    def test_slots(self):
+        signoff = signoff1()
+        self.assertFalse(hasattr(signoff, '__dict__'))
+        with self.assertRaises(AttributeError):
+            signoff.not_a_slot = True
+        self.assertEqual(copy.deepcopy(signoff).signet.signoff_id, signoff1.id)
+
+    def test_register_idempotent(self):
+        s = BasicSignoff.register('test.signoff.idempotent', label='Something')
+        self.assertIs(BasicSignoff.register('test.signoff.idempotent', label='Something'), s)
+        with self.assertRaises(ValueError):
+            BasicSignoff.register('test.signoff.idempotent', label='Something else')
+        with self.assertRaises(ValueError):
+            BasicSignoff.register('test.signoff2')  # registered with different kwargs
+
 
 class SignoffTypeTests(TestCase):
     @classmethod
@@ -82,6 +103,12 @@ class SignoffTypeTests(TestCase):
         self.assertFalse(restricted_so.can_sign(self.restricted_user))
         self.assertTrue(restricted_so.can_sign(self.signing_user))
 
+    def test_can_sign_perms_loaded_once(self):
+        signoff_types = (signoff2, BasicSignoff.register(id='test.can_sign.revoke_perm', perm='auth.revoke_perm'))
+        with self.assertNumQueries(2):  # auth backend loads user and group perms once, then caches them on the user
+            for signoff_type in signoff_types * 3:
+                signoff_type().can_sign(self.signing_user)
+
     def test_can_revoke(self):
         unrestricted_so = signoff1(user=self.unrestricted_user).save()
         restricted_so = signoff2(user=self.unrestricted_user).save()
@@ -127,16 +154,20 @@ class SignoffQuerysetTests(TestCase):
 
     def test_signet_queryset(self):
         so1_qs = signoff1.get_signet_queryset().signoffs()
-        self.assertListEqual(so1_qs, self.signoff1s)
+        self.assertQuerysetEqual(so1_qs, [s.signet.pk for s in self.signoff1s],
+                                 transform=signet_pk, ordered=False)
         so2_qs = signoff2.get_signet_queryset().signoffs()
-        self.assertListEqual(so2_qs, self.signoff2s)
+        self.assertQuerysetEqual(so2_qs, [s.signet.pk for s in self.signoff2s],
+                                 transform=signet_pk, ordered=False)
         so3_qs = signoff3.get_signet_queryset().signoffs()
-        self.assertListEqual(so3_qs, self.signoff3s)
+        self.assertQuerysetEqual(so3_qs, [s.signet.pk for s in self.signoff3s],
+                                 transform=signet_pk, ordered=False)
 
     def test_signet_queryset_filter(self):
         so_qs = signoff1.get_signet_queryset().filter(user=self.user).signoffs()
-        self.assertListEqual(so_qs,
-                             [so for so in self.signoff1s if so.signet.user==self.user])
+        self.assertQuerysetEqual(so_qs,
+                                 [so.signet.pk for so in self.signoff1s if so.signet.user==self.user],
+                                 transform=signet_pk, ordered=False)
 
 class SignetModelTests(SimpleTestCase):
     def test_default_signature(self):
@@ -151,6 +182,9 @@ class SignetModelTests(SimpleTestCase):
         s = signoffs.get('test.signoff1')
         o = Signet(signoff_id='test.signoff1')
         self.assertEqual(o.signoff_type, s)
+        o.signoff_id = signoff3.id
+        self.assertEqual(o.signoff_type, signoff3)
+        self.assertEqual(pickle.loads(pickle.dumps(o)).signoff_type, signoff3)
 
     def test_invalid_signoff_type(self):
         o = Signet(signoff_id='not.a.valid.type')
@@ -178,23 +212,39 @@ class SignetQuerysetTests(TestCase):
 
     def test_qs_basics(self):
         signoff_set = Signet.objects.filter(signoff_id='test.signoff1')
-        self.assertQuerysetEqual(signoff_set.order_by('pk'), [so.signet for so in self.signoff1_set])
+        self.assertCountEqual(signoff_set, [so.signet for so in self.signoff1_set])
 
     def test_qs_signoffs(self):
-        signoff_set = Signet.objects.order_by('pk').filter(signoff_id='test.signoff1').signoffs()
-        self.assertQuerysetEqual(signoff_set, self.signoff1_set)
+        signoff_set = Signet.objects.filter(signoff_id='test.signoff1').signoffs()
+        self.assertCountEqual(map(signet_pk, signoff_set), map(signet_pk, self.signoff1_set))
 
     def test_qs_signoffs_filter(self):
-        base_qs = Signet.objects.order_by('pk')
-        self.assertQuerysetEqual(base_qs.signoffs(signoff_id='test.signoff1'), self.signoff1_set)
-        self.assertQuerysetEqual(base_qs.signoffs(signoff_id='test.signoff2'), [])
-        self.assertQuerysetEqual(base_qs.signoffs(signoff_id='test.signoff3'), self.signoff3_set)
+        base_qs = Signet.objects.all()
+        self.assertCountEqual(map(signet_pk, base_qs.signoffs(signoff_id='test.signoff1')),
+                              map(signet_pk, self.signoff1_set))
+        self.assertCountEqual(base_qs.signoffs(signoff_id='test.signoff2'), [])
+        self.assertCountEqual(map(signet_pk, base_qs.signoffs(signoff_id='test.signoff3')),
+                              map(signet_pk, self.signoff3_set))
+
+    def test_qs_signoffs_eq(self):
+        signoffs = Signet.objects.filter(signoff_id='test.signoff1').order_by('pk').signoffs()
+        self.assertEqual(signoffs, list(self.signoff1_set))
+        self.assertEqual(signoffs, self.signoff1_set)
+        self.assertNotEqual(signoffs, self.signoff1_set[:1])
+        self.assertNotEqual(signoffs, 'not a signoff set')
+
+    def test_qs_signoffs_result_cache(self):
+        qs = Signet.objects.all()
+        self.assertEqual(len(qs.signoffs()), len(self.all_signoffs))
+        self.assertFalse(qs.query.select_related)
+        self.assertEqual(len(qs._result_cache), len(self.all_signoffs))
 
     def test_qs_signoffs_performance(self):
         base_qs = Signet.objects.all().order_by('pk')
-        with self.assertNumQueries(1):
+        with self.assertNumQueries(2):
             signoffs1 = base_qs.signoffs(signoff_id='test.signoff1')
             self.assertEqual(len(signoffs1), len(self.signoff1_set))
+            self.assertTrue(all(s.signet.user == self.user for s in signoffs1))
             signoffs2 = base_qs.signoffs(signoff_id='test.signoff2')
             self.assertEqual(len(signoffs2), 0)
             signoffs3 = base_qs.signoffs(signoff_id='test.signoff3')
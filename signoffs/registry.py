@@ -1,6 +1,7 @@
 """
     All Behavioural "Types" are loaded in a global registry to they can be accessed anywhere.
 """
+from types import MappingProxyType
 
 from persisting_theory import Registry
 from django.core.exceptions import ImproperlyConfigured
@@ -11,6 +12,10 @@ class ObjectRegistry(Registry):
     object_type = object
     name_attr = 'id'
 
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.view = MappingProxyType(self)  # read-only, live view of registered objects for fast, safe lookups
+
     def validate(self, data):
         """ Return True iff the data can is a unique, vaild candidate for storage in this registry """
         class_validator = getattr(data, 'validate', lambda: True)
@@ -48,11 +53,15 @@ def get_signoff_type(signoff_id_or_type):
     Return a registered Signoff Type or raise ImproperlyConfigured if no such type was registered.
     Convenience function accepts either a Type or an id, and checks for existence.
     """
-    signoff_type = signoffs.get(signoff_id_or_type) if isinstance(signoff_id_or_type, str) else signoff_id_or_type
-    if signoff_type is None:
+    if signoff_id_or_type is not None and not isinstance(signoff_id_or_type, str):
+        return signoff_id_or_type
+    try:
+        return signoffs.view[signoff_id_or_type]
+    except KeyError:
         raise ImproperlyConfigured(
-            'Sognoff Type {s} must be registered before it can be used.'.format(s=signoff_type))
-    return signoff_type
+            'Signoff Type {s} must be registered before it can be used. '
+            'See AUTODISCOVER settings to discover signoff types when django loads.'.format(s=signoff_id_or_type)
+        ) from None
 
 
 class ApprovalTypes(ObjectRegistry):
@@ -75,11 +84,15 @@ def get_approval_type(approval_id_or_type):
     Return a registered Approval Type or raise ImproperlyConfigured if not such type was registered.
     Convenience function accepts either a Type or an id, and checks for existence.
     """
-    approval_type = approvals.get(approval_id_or_type) if isinstance(approval_id_or_type, str) else approval_id_or_type
-    if approval_type is None:
+    if approval_id_or_type is not None and not isinstance(approval_id_or_type, str):
+        return approval_id_or_type
+    try:
+        return approvals.view[approval_id_or_type]
+    except KeyError:
         raise ImproperlyConfigured(
-            'Approval Type {a} must be registered before it can be used.'.format(a=approval_id_or_type))
-    return approval_type
+            'Approval Type {a} must be registered before it can be used. '
+            'See AUTODISCOVER settings to discover approval types when django loads.'.format(a=approval_id_or_type)
+        ) from None
 
 
 # Class decorator to simplify registering a base Type class
@@ -23,7 +23,7 @@ class SignoffSetTests(TestCase):
 
     def test_signoffset(self):
         self.assertEqual(models.Vacation.signoffset, signoffs.hr_signoff)
-        self.assertListEqual(self.vacation.signoffset.all(), self.signoffs)
+        self.assertEqual(self.vacation.signoffset.all(), self.signoffs)
 
 # TODO: extend these tests to exercise signoffset and signofffield, verify sigil field, revoke logic, etc.
 #       test revoking a SignoffOneToOneField - does this break DB constraint?
@@ -1,8 +1,9 @@
 """
 Tests for signoff Types registries
 """
+from django.core.exceptions import ImproperlyConfigured
 from django.test import SimpleTestCase
-from signoffs.registry import signoffs
+from signoffs.registry import signoffs, get_signoff_type
 
 from testapp import models
 
@@ -17,3 +18,11 @@ class TestSignoffsRegistry(SimpleTestCase):
     def test_signoff_type(self):
         o = models.Signet(signoff_id='testapp.agree')
         self.assertEqual(o.signoff_type, signoffs.get('testapp.agree'))
+
+    def test_get_signoff_type(self):
+        self.assertEqual(get_signoff_type('testapp.agree'), signoffs.get('testapp.agree'))
+        self.assertEqual(get_signoff_type(signoffs.get('testapp.agree')), signoffs.get('testapp.agree'))
+        with self.assertRaises(ImproperlyConfigured):
+            get_signoff_type('not.a.valid.type')
+        with self.assertRaises(TypeError):
+            signoffs.view['testapp.agree'] = None  # read-only view